@@ -1,24 +1,60 @@
 #!/usr/bin/env python3
+import heapq
 import json
 import hmac
 import hashlib
+import functools
 import base64
 import os
+import selectors
 import socket
 import ssl
+import struct
 import subprocess
 import threading
 import time
+import types
 import urllib.error
 import urllib.request
 import secrets
 import logging
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
-from urllib.parse import parse_qs, urlparse, urlencode
+from urllib.parse import parse_qsl, urlparse, urlencode
 from collections import deque
-from dataclasses import dataclass, asdict, field
-from typing import Optional
-from datetime import datetime
+from dataclasses import dataclass, asdict, field, replace
+from typing import NamedTuple, Optional
+
+try:
+    # Optional accelerator for hot JSON paths; the gateway must keep
+    # working on a bare stdlib install, so fall back to json when absent.
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+if _orjson is not None:
+    _json_dumps_bytes = _orjson.dumps
+    _json_loads = _orjson.loads
+else:
+    def _json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+
+# Default permission set shared by JWT-authenticated and auth-disabled
+# requests; immutable so one tuple serves every request.
+_DEFAULT_PERMISSIONS = ("read", "write")
+
+# Shared result for the auth-disabled fast path. The proxy keeps callers
+# from mutating the one dict every request shares.
+_ANON_USER = types.MappingProxyType(
+    {
+        "user_id": "anonymous",
+        "permissions": _DEFAULT_PERMISSIONS,
+        "auth_method": "disabled",
+    }
+)
+_ANON_RESULT = (_ANON_USER, "")
 
 # Configure audit logger
 audit_logger = logging.getLogger("veloz.audit")
@@ -41,19 +77,35 @@ class JWTManager:
     def __init__(self, secret_key: str, token_expiry_seconds: int = 3600):
         self._secret = secret_key.encode("utf-8") if secret_key else secrets.token_bytes(32)
         self._expiry = token_expiry_seconds
+        # Prebind hot callables so create/verify skip the module-attribute
+        # lookups on every request.
+        self._blake2b = hashlib.blake2b
+        self._hmac_digest = hmac.digest
+        self._b64encode = base64.urlsafe_b64encode
+        self._b64decode = base64.urlsafe_b64decode
+        # Keyed BLAKE2b signs in one compression pass vs HMAC-SHA256's two.
+        # New tokens use it ("BLK2"); verification still accepts HS256.
+        # BLAKE2b keys are capped at 64 bytes, so fold longer secrets down.
+        self._blake2_key = (
+            self._secret if len(self._secret) <= 64 else hashlib.sha256(self._secret).digest()
+        )
+        # The header is constant; encode it once instead of per token.
+        self._header_b64 = self._b64url_encode(json.dumps({"alg": "BLK2", "typ": "JWT"}).encode("utf-8"))
+        self._verify_algs = {
+            self._header_b64.encode("ascii"): "BLK2",
+            self._b64url_encode(
+                json.dumps({"alg": "HS256", "typ": "JWT"}).encode("utf-8")
+            ).encode("ascii"): "HS256",
+        }
 
     def _b64url_encode(self, data: bytes) -> str:
-        return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+        return self._b64encode(data).rstrip(b"=").decode("ascii")
 
-    def _b64url_decode(self, data: str) -> bytes:
-        padding = 4 - len(data) % 4
-        if padding != 4:
-            data += "=" * padding
-        return base64.urlsafe_b64decode(data)
+    def _b64url_decode(self, data: bytes) -> bytes:
+        return self._b64decode(data + b"=" * (-len(data) & 3))
 
     def create_token(self, user_id: str, api_key_id: Optional[str] = None) -> str:
         """Create a JWT token for the given user."""
-        header = {"alg": "HS256", "typ": "JWT"}
         now = int(time.time())
         payload = {
             "sub": user_id,
@@ -63,30 +115,46 @@ class JWTManager:
         if api_key_id:
             payload["kid"] = api_key_id
 
-        header_b64 = self._b64url_encode(json.dumps(header).encode("utf-8"))
-        payload_b64 = self._b64url_encode(json.dumps(payload).encode("utf-8"))
+        header_b64 = self._header_b64
+        payload_b64 = self._b64url_encode(_json_dumps_bytes(payload))
         message = f"{header_b64}.{payload_b64}"
-        signature = hmac.new(self._secret, message.encode("utf-8"), hashlib.sha256).digest()
+        signature = self._blake2b(
+            message.encode("utf-8"), key=self._blake2_key, digest_size=32
+        ).digest()
         sig_b64 = self._b64url_encode(signature)
         return f"{message}.{sig_b64}"
 
     def verify_token(self, token: str) -> Optional[dict]:
         """Verify a JWT token and return the payload if valid."""
         try:
-            parts = token.split(".")
+            # Work on bytes end-to-end; tokens are ASCII by construction.
+            parts = token.encode("ascii").split(b".")
             if len(parts) != 3:
                 return None
 
             header_b64, payload_b64, sig_b64 = parts
-            message = f"{header_b64}.{payload_b64}"
-            expected_sig = hmac.new(self._secret, message.encode("utf-8"), hashlib.sha256).digest()
+            message = header_b64 + b"." + payload_b64
+
+            alg = self._verify_algs.get(header_b64)
+            if alg is None:
+                alg = _json_loads(self._b64url_decode(header_b64)).get("alg")
+            if alg == "BLK2":
+                expected_sig = self._blake2b(
+                    message, key=self._blake2_key, digest_size=32
+                ).digest()
+            elif alg == "HS256":
+                expected_sig = self._hmac_digest(self._secret, message, "sha256")
+            else:
+                return None
             actual_sig = self._b64url_decode(sig_b64)
 
             if not hmac.compare_digest(expected_sig, actual_sig):
                 return None
 
-            payload = json.loads(self._b64url_decode(payload_b64))
-            if payload.get("exp", 0) < int(time.time()):
+            payload = _json_loads(self._b64url_decode(payload_b64))
+            # exp is an int; compare against the raw float clock instead of
+            # constructing a fresh int per verification.
+            if payload.get("exp", 0) < time.time():
                 return None
 
             return payload
@@ -102,13 +170,13 @@ class JWTManager:
 @dataclass
 class APIKey:
     key_id: str
-    key_hash: str  # Store hash, not the actual key
+    key_hash: bytes  # Store raw sha256 digest, not the actual key
     user_id: str
     name: str
     created_at: int
     last_used_at: Optional[int] = None
     revoked: bool = False
-    permissions: list = field(default_factory=lambda: ["read", "write"])
+    permissions: list = field(default_factory=lambda: list(_DEFAULT_PERMISSIONS))
 
 
 class APIKeyManager:
@@ -117,10 +185,17 @@ class APIKeyManager:
     def __init__(self):
         self._mu = threading.Lock()
         self._keys: dict[str, APIKey] = {}  # key_id -> APIKey
-        self._key_lookup: dict[str, str] = {}  # key_hash -> key_id
-
-    def _hash_key(self, key: str) -> str:
-        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+        self._key_lookup: dict[bytes, str] = {}  # key_hash -> key_id
+        self._user_keys: dict[str, list[str]] = {}  # user_id -> [key_id, ...]
+        self._sha256 = hashlib.sha256  # prebound for the per-request hash
+        # Read-mostly snapshot for lock-free validation. Rebuilt under the
+        # lock after every mutation; the attribute store is atomic under
+        # the GIL, so readers always see a consistent mapping.
+        self._lookup_snapshot: dict[bytes, APIKey] = {}
+
+    def _hash_key(self, key: str) -> bytes:
+        # Raw digest: skips hex encoding and halves the dict key size.
+        return self._sha256(key.encode("utf-8")).digest()
 
     def create_key(self, user_id: str, name: str, permissions: Optional[list] = None) -> tuple[str, str]:
         """Create a new API key. Returns (key_id, raw_key)."""
@@ -134,28 +209,33 @@ class APIKeyManager:
             user_id=user_id,
             name=name,
             created_at=int(time.time()),
-            permissions=permissions or ["read", "write"],
+            permissions=permissions or list(_DEFAULT_PERMISSIONS),
         )
 
         with self._mu:
             self._keys[key_id] = api_key
             self._key_lookup[key_hash] = key_id
+            self._user_keys.setdefault(user_id, []).append(key_id)
+            self._rebuild_snapshot()
 
-        audit_logger.info(f"API key created: key_id={key_id}, user={user_id}, name={name}")
+        audit_logger.info("API key created: key_id=%s, user=%s, name=%s", key_id, user_id, name)
         return key_id, raw_key
 
+    def _rebuild_snapshot(self) -> None:
+        """Publish a fresh lookup snapshot. Caller must hold self._mu."""
+        self._lookup_snapshot = {
+            key_hash: self._keys[key_id]
+            for key_hash, key_id in self._key_lookup.items()
+        }
+
     def validate_key(self, raw_key: str) -> Optional[APIKey]:
         """Validate an API key and return the APIKey object if valid."""
-        key_hash = self._hash_key(raw_key)
-        with self._mu:
-            key_id = self._key_lookup.get(key_hash)
-            if not key_id:
-                return None
-            api_key = self._keys.get(key_id)
-            if not api_key or api_key.revoked:
-                return None
-            api_key.last_used_at = int(time.time())
-            return api_key
+        api_key = self._lookup_snapshot.get(self._hash_key(raw_key))
+        if not api_key or api_key.revoked:
+            return None
+        # Plain attribute store; atomic under the GIL, no lock needed.
+        api_key.last_used_at = int(time.time())
+        return api_key
 
     def revoke_key(self, key_id: str) -> bool:
         """Revoke an API key."""
@@ -166,25 +246,26 @@ class APIKeyManager:
             api_key.revoked = True
             if api_key.key_hash in self._key_lookup:
                 del self._key_lookup[api_key.key_hash]
-        audit_logger.info(f"API key revoked: key_id={key_id}")
+            self._rebuild_snapshot()
+        audit_logger.info("API key revoked: key_id=%s", key_id)
         return True
 
     def list_keys(self, user_id: Optional[str] = None) -> list[dict]:
         """List all API keys, optionally filtered by user."""
         with self._mu:
+            if user_id:
+                source = [
+                    self._keys[key_id]
+                    for key_id in self._user_keys.get(user_id, ())
+                    if key_id in self._keys
+                ]
+            else:
+                source = list(self._keys.values())
             keys = []
-            for api_key in self._keys.values():
-                if user_id and api_key.user_id != user_id:
-                    continue
-                keys.append({
-                    "key_id": api_key.key_id,
-                    "user_id": api_key.user_id,
-                    "name": api_key.name,
-                    "created_at": api_key.created_at,
-                    "last_used_at": api_key.last_used_at,
-                    "revoked": api_key.revoked,
-                    "permissions": api_key.permissions,
-                })
+            for api_key in source:
+                d = asdict(api_key)
+                d.pop("key_hash", None)  # never expose the stored hash
+                keys.append(d)
             return keys
 
 
@@ -193,93 +274,123 @@ class APIKeyManager:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenBucket:
     tokens: float
-    last_update: float
+    last_update_ns: int  # time.monotonic_ns() of last refill
     capacity: float
     refill_rate: float  # tokens per second
 
 
+class _RateLimiterShard:
+    """One lock + bucket table; shards keep unrelated clients off one mutex."""
+
+    __slots__ = ("mu", "buckets", "heap", "last_cleanup_ns")
+
+    def __init__(self):
+        self.mu = threading.Lock()
+        self.buckets: dict[str, TokenBucket] = {}
+        # Lazy min-heap of (last seen last_update_ns, key) so cleanup pops
+        # only the stale prefix instead of scanning every bucket.
+        self.heap: list[tuple[int, str]] = []
+        self.last_cleanup_ns = time.monotonic_ns()
+
+
 class RateLimiter:
     """Token bucket rate limiter."""
 
+    _NUM_SHARDS = 16  # power of two so the shard index is a mask
+
     def __init__(
         self,
         capacity: int = 100,
         refill_rate: float = 10.0,
         window_seconds: int = 60,
     ):
-        self._mu = threading.Lock()
-        self._buckets: dict[str, TokenBucket] = {}
+        self._shards = [_RateLimiterShard() for _ in range(self._NUM_SHARDS)]
         self._capacity = capacity
         self._refill_rate = refill_rate
         self._window = window_seconds
         self._cleanup_interval = 300  # Cleanup old buckets every 5 minutes
-        self._last_cleanup = time.time()
 
-    def _get_bucket(self, key: str) -> TokenBucket:
-        now = time.time()
-        bucket = self._buckets.get(key)
+    def _shard_for(self, key: str) -> _RateLimiterShard:
+        return self._shards[hash(key) & (self._NUM_SHARDS - 1)]
+
+    def _get_bucket(self, shard: _RateLimiterShard, key: str, now_ns: int) -> TokenBucket:
+        bucket = shard.buckets.get(key)
         if bucket is None:
             bucket = TokenBucket(
                 tokens=float(self._capacity),
-                last_update=now,
+                last_update_ns=now_ns,
                 capacity=float(self._capacity),
                 refill_rate=self._refill_rate,
             )
-            self._buckets[key] = bucket
+            shard.buckets[key] = bucket
+            heapq.heappush(shard.heap, (now_ns, key))
         return bucket
 
-    def _refill(self, bucket: TokenBucket) -> None:
-        now = time.time()
-        elapsed = now - bucket.last_update
+    def _refill(self, bucket: TokenBucket, now_ns: int) -> None:
+        elapsed = (now_ns - bucket.last_update_ns) * 1e-9
         bucket.tokens = min(bucket.capacity, bucket.tokens + elapsed * bucket.refill_rate)
-        bucket.last_update = now
+        bucket.last_update_ns = now_ns
 
     def check_rate_limit(self, key: str, cost: float = 1.0) -> tuple[bool, dict]:
         """
         Check if request is allowed under rate limit.
         Returns (allowed, headers_dict).
         """
-        with self._mu:
+        # One monotonic sample per check; every step below shares it.
+        # Integer nanoseconds keep the bucket math immune to wall-clock
+        # jumps; the wall clock is read only for the Reset header.
+        now_ns = time.monotonic_ns()
+        shard = self._shard_for(key)
+        with shard.mu:
             # Periodic cleanup
-            now = time.time()
-            if now - self._last_cleanup > self._cleanup_interval:
-                self._cleanup_old_buckets()
-                self._last_cleanup = now
+            if now_ns - shard.last_cleanup_ns > self._cleanup_interval * 1_000_000_000:
+                self._cleanup_old_buckets(shard, now_ns)
+                shard.last_cleanup_ns = now_ns
 
-            bucket = self._get_bucket(key)
-            self._refill(bucket)
+            bucket = self._get_bucket(shard, key, now_ns)
+            self._refill(bucket, now_ns)
 
             allowed = bucket.tokens >= cost
             if allowed:
                 bucket.tokens -= cost
+            capacity = bucket.capacity
+            tokens = bucket.tokens
+            refill_rate = bucket.refill_rate
+
+        # Only the bucket math needs the lock; header formatting (int
+        # conversions, str building, dict allocation) runs outside it.
+        # Calculate reset time (when bucket will be full again)
+        reset_seconds = int((capacity - tokens) / refill_rate) if refill_rate > 0 else 0
+
+        headers = {
+            "X-RateLimit-Limit": str(int(capacity)),
+            "X-RateLimit-Remaining": str(max(0, int(tokens))),
+            "X-RateLimit-Reset": str(int(time.time()) + reset_seconds),
+        }
 
-            # Calculate reset time (when bucket will be full again)
-            tokens_needed = bucket.capacity - bucket.tokens
-            reset_seconds = int(tokens_needed / bucket.refill_rate) if bucket.refill_rate > 0 else 0
-
-            headers = {
-                "X-RateLimit-Limit": str(int(bucket.capacity)),
-                "X-RateLimit-Remaining": str(max(0, int(bucket.tokens))),
-                "X-RateLimit-Reset": str(int(now) + reset_seconds),
-            }
-
-            if not allowed:
-                headers["Retry-After"] = str(int((cost - bucket.tokens) / bucket.refill_rate) + 1)
-
-            return allowed, headers
-
-    def _cleanup_old_buckets(self) -> None:
-        """Remove buckets that haven't been used recently."""
-        now = time.time()
-        stale_keys = [
-            key for key, bucket in self._buckets.items()
-            if now - bucket.last_update > self._window * 10
-        ]
-        for key in stale_keys:
-            del self._buckets[key]
+        if not allowed:
+            headers["Retry-After"] = str(int((cost - tokens) / refill_rate) + 1)
+
+        return allowed, headers
+
+    def _cleanup_old_buckets(self, shard: _RateLimiterShard, now_ns: int) -> None:
+        """Remove buckets that haven't been used recently. Caller holds shard.mu."""
+        cutoff = now_ns - self._window * 10 * 1_000_000_000
+        heap = shard.heap
+        while heap and heap[0][0] <= cutoff:
+            _, key = heapq.heappop(heap)
+            bucket = shard.buckets.get(key)
+            if bucket is None:
+                continue
+            if bucket.last_update_ns <= cutoff:
+                del shard.buckets[key]
+            else:
+                # Bucket was used since it was pushed; requeue at its
+                # current timestamp (entries in the heap may be stale).
+                heapq.heappush(heap, (bucket.last_update_ns, key))
 
 
 # =============================================================================
@@ -304,8 +415,27 @@ class AuthManager:
         self._rate_limiter = RateLimiter(capacity=rate_limit_capacity, refill_rate=rate_limit_refill)
         self._admin_password = os.environ.get("VELOZ_ADMIN_PASSWORD", "")
 
-        # Public endpoints that don't require authentication
-        self._public_endpoints = {"/health", "/api/stream"}
+        # Short-TTL cache of verified JWT payloads keyed by a token
+        # fingerprint, so repeat requests with the same Bearer token skip
+        # signature verification. Entries never outlive the token's exp.
+        self._jwt_cache_mu = threading.Lock()
+        self._jwt_cache: dict[bytes, tuple[float, dict]] = {}  # fp -> (valid_until, payload)
+        self._jwt_cache_ttl = 5.0
+        self._jwt_cache_max = 10000
+
+        # Equivalent cache for API key validations. Entries hold the live
+        # APIKey object, whose revoked flag is re-checked on every hit, so
+        # revocation still takes effect immediately.
+        self._apikey_cache_mu = threading.Lock()
+        self._apikey_cache: dict[bytes, tuple[float, APIKey]] = {}  # fp -> (valid_until, key)
+        self._apikey_cache_ttl = 30.0
+        self._apikey_cache_max = 5000
+
+        # Public endpoints that don't require authentication. Exact
+        # matches live in a frozenset; /api/stream is a prefix so stream
+        # sub-paths stay public too. startswith(tuple) runs in C.
+        self._public_endpoints = frozenset({"/health"})
+        self._public_prefixes = ("/api/stream",)
 
         # Create default admin API key if password is set
         if self._admin_password:
@@ -316,26 +446,32 @@ class AuthManager:
         return self._enabled
 
     def is_public_endpoint(self, path: str) -> bool:
-        return path in self._public_endpoints
+        return path in self._public_endpoints or path.startswith(self._public_prefixes)
 
-    def authenticate(self, headers: dict) -> tuple[Optional[dict], str]:
+    def authenticate(self, headers) -> tuple[Optional[dict], str]:
         """
         Authenticate a request.
+        headers is any mapping supporting .get (e.g. http.client.HTTPMessage).
         Returns (user_info, error_message).
         user_info contains: user_id, permissions, auth_method
         """
         if not self._enabled:
-            return {"user_id": "anonymous", "permissions": ["read", "write"], "auth_method": "disabled"}, ""
+            return _ANON_RESULT
 
         # Check for Bearer token (JWT)
         auth_header = headers.get("Authorization", "")
         if auth_header.startswith("Bearer "):
             token = auth_header[7:]
-            payload = self._jwt.verify_token(token)
+            # Reject structurally invalid tokens before paying for the
+            # fingerprint hash and signature check; scanner traffic mostly
+            # dies on this one C-level count.
+            if token.count(".") != 2:
+                return None, "invalid_token"
+            payload = self._verify_token_cached(token)
             if payload:
                 return {
                     "user_id": payload.get("sub", "unknown"),
-                    "permissions": ["read", "write"],
+                    "permissions": _DEFAULT_PERMISSIONS,
                     "auth_method": "jwt",
                 }, ""
             return None, "invalid_token"
@@ -343,7 +479,7 @@ class AuthManager:
         # Check for API key
         api_key = headers.get("X-API-Key", "")
         if api_key:
-            key_obj = self._api_keys.validate_key(api_key)
+            key_obj = self._validate_api_key_cached(api_key)
             if key_obj:
                 return {
                     "user_id": key_obj.user_id,
@@ -355,6 +491,43 @@ class AuthManager:
 
         return None, "authentication_required"
 
+    def _verify_token_cached(self, token: str) -> Optional[dict]:
+        """Verify a JWT, reusing a recent verification when available."""
+        fp = hashlib.sha256(token.encode("utf-8")).digest()[:16]
+        now = time.time()
+        with self._jwt_cache_mu:
+            hit = self._jwt_cache.get(fp)
+            if hit is not None and now < hit[0]:
+                return hit[1]
+        payload = self._jwt.verify_token(token)
+        if payload:  # never cache failures
+            valid_until = min(now + self._jwt_cache_ttl, float(payload.get("exp", now)))
+            with self._jwt_cache_mu:
+                if len(self._jwt_cache) >= self._jwt_cache_max:
+                    self._jwt_cache.clear()
+                self._jwt_cache[fp] = (valid_until, payload)
+        return payload
+
+    def _validate_api_key_cached(self, raw_key: str) -> Optional[APIKey]:
+        """Validate an API key, reusing a recent validation when available."""
+        fp = hashlib.sha256(raw_key.encode("utf-8")).digest()[:16]
+        now = time.time()
+        with self._apikey_cache_mu:
+            hit = self._apikey_cache.get(fp)
+            if hit is not None and now < hit[0]:
+                key_obj = hit[1]
+                if key_obj.revoked:  # revocation wins over the cache
+                    return None
+                key_obj.last_used_at = int(now)
+                return key_obj
+        key_obj = self._api_keys.validate_key(raw_key)
+        if key_obj is not None:  # never cache failures
+            with self._apikey_cache_mu:
+                if len(self._apikey_cache) >= self._apikey_cache_max:
+                    self._apikey_cache.clear()
+                self._apikey_cache[fp] = (now + self._apikey_cache_ttl, key_obj)
+        return key_obj
+
     def check_rate_limit(self, identifier: str) -> tuple[bool, dict]:
         """Check rate limit for the given identifier."""
         return self._rate_limiter.check_rate_limit(identifier)
@@ -364,7 +537,7 @@ class AuthManager:
         # Simple password check for admin
         if user_id == "admin" and self._admin_password and password == self._admin_password:
             token = self._jwt.create_token(user_id)
-            audit_logger.info(f"JWT token created for user: {user_id}")
+            audit_logger.info("JWT token created for user: %s", user_id)
             return token
         return None
 
@@ -391,33 +564,37 @@ class EngineBridge:
         order_store,
         account_store,
     ):
+        # Binary pipes: events are parsed straight from bytes (orjson
+        # accepts bytes), skipping the per-line UTF-8 decode of text mode.
         self._proc = subprocess.Popen(
             engine_cmd,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
         )
         self._lock = threading.Lock()
-        self._cv = threading.Condition(self._lock)
+        # SSE waiters register (last_seen_id, Event) pairs; each new event
+        # wakes only the waiters it satisfies instead of notify_all()
+        # stampeding every subscriber on every event.
+        self._waiters: list[tuple[int, threading.Event]] = []
         self._latest_market = {"symbol": "BTCUSDT", "price": None, "ts_ns": None}
-        self._orders = []
         self._max_orders = 200
+        self._orders = deque(maxlen=self._max_orders)
         self._events = deque(maxlen=500)
         self._next_event_id = 0
         self._market_source = market_source
         self._market_symbol = market_symbol
         self._binance_base_url = binance_base_url
         self._market_thread = None
+        self._stop_event = threading.Event()
         self._external_market_last_ok_ns = 0
         self._order_store = order_store
         self._account_store = account_store
 
-        self._stdout_thread = threading.Thread(target=self._read_stdout, daemon=True)
-        self._stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
-        self._stdout_thread.start()
-        self._stderr_thread.start()
+        self._reader_thread = threading.Thread(
+            target=self._read_engine_pipes, daemon=True
+        )
+        self._reader_thread.start()
 
         if self._market_source == "binance_rest":
             self._market_thread = threading.Thread(
@@ -426,6 +603,7 @@ class EngineBridge:
             self._market_thread.start()
 
     def stop(self):
+        self._stop_event.set()
         try:
             if self._proc.poll() is None:
                 self._proc.terminate()
@@ -433,8 +611,11 @@ class EngineBridge:
             pass
 
     def market(self):
-        with self._lock:
-            return dict(self._latest_market)
+        # _latest_market is only ever replaced wholesale (never mutated in
+        # place), and reference assignment is atomic under the GIL, so
+        # readers can take the current snapshot without the lock or a copy.
+        # Callers must treat the returned dict as read-only.
+        return self._latest_market
 
     def orders(self):
         with self._lock:
@@ -458,53 +639,119 @@ class EngineBridge:
                     self._events[-1]["_id"] if self._events else 0
                 )
 
+            if not self._events or self._events[-1]["_id"] <= last_id:
+                return [], last_id
+
+            # _id is strictly monotonic, so unseen events are a suffix of
+            # the ordered deque: walk in from the right and stop at the
+            # first already-seen id instead of scanning the whole buffer.
             out = []
-            for e in self._events:
-                if e["_id"] > last_id:
-                    out.append(e)
-            new_last = out[-1]["_id"] if out else last_id
-            return out, new_last
+            for e in reversed(self._events):
+                if e["_id"] <= last_id:
+                    break
+                out.append(e)
+            out.reverse()
+            return out, out[-1]["_id"]
 
     def wait_for_event(self, last_id, timeout_s):
-        end = time.time() + timeout_s
         with self._lock:
-            while True:
-                if self._events and (
-                    last_id is None or self._events[-1]["_id"] > last_id
-                ):
-                    return True
-                remaining = end - time.time()
-                if remaining <= 0:
-                    return False
-                self._cv.wait(timeout=remaining)
+            if self._events and (
+                last_id is None or self._events[-1]["_id"] > last_id
+            ):
+                return True
+            waiter = (last_id or 0, threading.Event())
+            self._waiters.append(waiter)
+        if waiter[1].wait(timeout_s):
+            return True
+        with self._lock:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass  # raced with a wakeup; treat as satisfied
+        return waiter[1].is_set()
+
+    def _wake_waiters_locked(self):
+        """Wake waiters satisfied by the newest event. Caller holds _lock."""
+        if not self._waiters:
+            return
+        newest = self._next_event_id
+        remaining = []
+        for last_id, ev in self._waiters:
+            if newest > last_id:
+                ev.set()
+            else:
+                remaining.append((last_id, ev))
+        self._waiters = remaining
 
     def place_order(self, side, symbol, qty, price, client_order_id):
         if self._proc.stdin is None:
             raise RuntimeError("engine stdin unavailable")
         cmd = f"ORDER {side} {symbol} {qty} {price} {client_order_id}\n"
-        self._proc.stdin.write(cmd)
+        self._proc.stdin.write(cmd.encode("utf-8"))
         self._proc.stdin.flush()
 
     def cancel_order(self, client_order_id):
         if self._proc.stdin is None:
             raise RuntimeError("engine stdin unavailable")
         cmd = f"CANCEL {client_order_id}\n"
-        self._proc.stdin.write(cmd)
+        self._proc.stdin.write(cmd.encode("utf-8"))
         self._proc.stdin.flush()
 
-    def _read_stdout(self):
-        if self._proc.stdout is None:
-            return
-        for line in self._proc.stdout:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                evt = json.loads(line)
-            except Exception:
+    def _read_engine_pipes(self):
+        # One selector-driven thread services both engine pipes: stdout is
+        # parsed as NDJSON, stderr is drained and discarded. All lines from
+        # a single wakeup are applied under one lock acquisition.
+        sel = selectors.DefaultSelector()
+        buffers = {}
+        for pipe, is_stdout in ((self._proc.stdout, True), (self._proc.stderr, False)):
+            if pipe is None:
                 continue
-            t = evt.get("type")
-            with self._lock:
+            fd = pipe.fileno()
+            os.set_blocking(fd, False)
+            sel.register(fd, selectors.EVENT_READ, is_stdout)
+            buffers[fd] = bytearray()
+        while buffers:
+            for key, _ in sel.select():
+                fd = key.fd
+                try:
+                    chunk = os.read(fd, 65536)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    chunk = b""
+                if not chunk:
+                    sel.unregister(fd)
+                    del buffers[fd]
+                    continue
+                if not key.data:
+                    continue
+                buf = buffers[fd]
+                buf += chunk
+                if b"\n" not in chunk:
+                    continue
+                lines = buf.split(b"\n")
+                buffers[fd] = bytearray(lines.pop())
+                batch = []
+                for line in lines:
+                    line = line.strip()
+                    # Engine events are NDJSON objects; anything not
+                    # starting with "{" (stray engine chatter, blank
+                    # lines) is skipped without paying for a parse
+                    # attempt and its exception.
+                    if not line or line[0] != 0x7B:
+                        continue
+                    try:
+                        batch.append(_json_loads(line))
+                    except Exception:
+                        continue
+                if batch:
+                    self._apply_engine_events(batch)
+        sel.close()
+
+    def _apply_engine_events(self, batch):
+        with self._lock:
+            for evt in batch:
+                t = evt.get("type")
                 if (
                     t == "market"
                     and self._market_source == "binance_rest"
@@ -523,8 +770,6 @@ class EngineBridge:
                     }
                 elif t in ("order_update", "fill", "error"):
                     self._orders.append(evt)
-                    if len(self._orders) > self._max_orders:
-                        self._orders = self._orders[-self._max_orders :]
                 if (
                     t in ("order_update", "fill", "order_state")
                     and self._order_store is not None
@@ -536,13 +781,7 @@ class EngineBridge:
                     self._account_store.apply_event(
                         {k: v for k, v in evt.items() if k != "_id"}
                     )
-                self._cv.notify_all()
-
-    def _drain_stderr(self):
-        if self._proc.stderr is None:
-            return
-        for _ in self._proc.stderr:
-            pass
+            self._wake_waiters_locked()
 
     def _emit_event(self, evt):
         with self._lock:
@@ -555,7 +794,7 @@ class EngineBridge:
                     "price": evt.get("price"),
                     "ts_ns": evt.get("ts_ns"),
                 }
-            self._cv.notify_all()
+            self._wake_waiters_locked()
 
     def _poll_binance_price(self):
         last_error_emit = 0.0
@@ -568,15 +807,16 @@ class EngineBridge:
                 url = f"{base}/api/v3/ticker/price?symbol={symbol}"
                 req = urllib.request.Request(url, headers={"User-Agent": "VeloZ/0.1"})
                 with urllib.request.urlopen(req, timeout=2.0) as resp:
-                    raw = resp.read().decode("utf-8", errors="replace")
-                data = json.loads(raw)
+                    raw = resp.read()
+                data = _json_loads(raw)
                 price = float(data["price"])
-                self._external_market_last_ok_ns = time.time_ns()
+                now_ns = time.time_ns()  # one sample for both uses
+                self._external_market_last_ok_ns = now_ns
                 self._emit_event(
                     {
                         "type": "market",
                         "symbol": symbol,
-                        "ts_ns": time.time_ns(),
+                        "ts_ns": now_ns,
                         "price": price,
                     }
                 )
@@ -591,7 +831,10 @@ class EngineBridge:
                             "message": "market_source_error",
                         }
                     )
-            time.sleep(0.5)
+            # Event.wait doubles as the poll interval and an interruptible
+            # shutdown signal, so stop() does not have to ride out a sleep.
+            if self._stop_event.wait(0.5):
+                return
 
     def emit_event(self, evt):
         t = evt.get("type")
@@ -607,12 +850,10 @@ class EngineBridge:
                 }
             elif t in ("order_update", "fill", "error"):
                 self._orders.append(evt)
-                if len(self._orders) > self._max_orders:
-                    self._orders = self._orders[-self._max_orders :]
-            self._cv.notify_all()
+            self._wake_waiters_locked()
 
 
-@dataclass
+@dataclass(slots=True)
 class BalanceState:
     asset: str
     free: float
@@ -622,13 +863,13 @@ class BalanceState:
 class AccountStore:
     def __init__(self):
         self._mu = threading.Lock()
-        self._balances: dict[str, BalanceState] = {}
-        self._last_ts_ns: int | None = None
+        # (last_ts_ns, balances-by-asset), swapped wholesale by writers so
+        # snapshot() can read the current pair without the lock.
+        self._state: tuple[int | None, dict[str, BalanceState]] = (None, {})
 
     def set_balances(self, balances: list[BalanceState], ts_ns: int | None):
         with self._mu:
-            self._balances = {b.asset: b for b in balances}
-            self._last_ts_ns = ts_ns
+            self._state = (ts_ns, {b.asset: b for b in balances})
 
     def apply_event(self, evt: dict):
         if evt.get("type") != "account":
@@ -638,7 +879,7 @@ class AccountStore:
         if not isinstance(balances, list):
             if ts_ns is not None:
                 with self._mu:
-                    self._last_ts_ns = ts_ns
+                    self._state = (ts_ns, self._state[1])
             return
         items = []
         for b in balances:
@@ -660,17 +901,17 @@ class AccountStore:
             self.set_balances(items, ts_ns)
         elif ts_ns is not None:
             with self._mu:
-                self._last_ts_ns = ts_ns
+                self._state = (ts_ns, self._state[1])
 
     def snapshot(self):
-        with self._mu:
-            return {
-                "ts_ns": self._last_ts_ns,
-                "balances": [asdict(b) for b in self._balances.values()],
-            }
+        ts_ns, balances = self._state  # atomic ref load; no lock needed
+        return {
+            "ts_ns": ts_ns,
+            "balances": [asdict(b) for b in balances.values()],
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderState:
     client_order_id: str
     symbol: str | None = None
@@ -685,37 +926,144 @@ class OrderState:
     last_ts_ns: int | None = None
 
 
+def _f(v):
+    """Best-effort float coercion; None when absent or unparseable."""
+    try:
+        return float(v) if v is not None else None
+    except Exception:
+        return None
+
+
+def _apply_order_state(st: OrderState, evt: dict) -> None:
+    v = evt.get("symbol")
+    if v:
+        st.symbol = v
+    v = evt.get("side")
+    if v:
+        st.side = v
+    v = _f(evt.get("order_qty"))
+    if v is not None:
+        st.order_qty = v
+    v = _f(evt.get("limit_price"))
+    if v is not None:
+        st.limit_price = v
+    v = evt.get("venue_order_id")
+    if v:
+        st.venue_order_id = v
+    v = evt.get("status")
+    if v:
+        st.status = v
+    v = evt.get("reason")
+    if v:
+        st.reason = v
+    v = _f(evt.get("executed_qty"))
+    if v is not None:
+        st.executed_qty = v
+    v = _f(evt.get("avg_price"))
+    if v is not None:
+        st.avg_price = v
+    v = evt.get("last_ts_ns")
+    if v:
+        st.last_ts_ns = v
+
+
+def _apply_order_update(st: OrderState, evt: dict) -> None:
+    v = evt.get("symbol")
+    if v:
+        st.symbol = v
+    v = evt.get("side")
+    if v:
+        st.side = v
+    v = _f(evt.get("qty"))
+    if v is not None:
+        st.order_qty = v
+    v = _f(evt.get("price"))
+    if v is not None:
+        st.limit_price = v
+    v = evt.get("venue_order_id")
+    if v:
+        st.venue_order_id = v
+    v = evt.get("status")
+    if v:
+        st.status = v
+    v = evt.get("reason")
+    if v:
+        st.reason = v
+    v = evt.get("ts_ns")
+    if v:
+        st.last_ts_ns = v
+
+
+def _apply_fill(st: OrderState, evt: dict) -> None:
+    v = evt.get("symbol")
+    if v:
+        st.symbol = v
+    qty = _f(evt.get("qty"))
+    if qty is not None:
+        st.executed_qty += qty
+    price = _f(evt.get("price"))
+    if st.executed_qty > 0 and price is not None:
+        st.avg_price = price
+    v = evt.get("ts_ns")
+    if v:
+        st.last_ts_ns = v
+    if st.order_qty is not None and st.order_qty > 0:
+        if st.executed_qty + 1e-12 >= st.order_qty:
+            if st.status not in ("CANCELLED", "REJECTED", "EXPIRED"):
+                st.status = "FILLED"
+        elif st.executed_qty > 0:
+            if st.status not in ("CANCELLED", "REJECTED", "EXPIRED"):
+                st.status = "PARTIALLY_FILLED"
+
+
+_ORDER_EVENT_HANDLERS = {
+    "order_state": _apply_order_state,
+    "order_update": _apply_order_update,
+    "fill": _apply_fill,
+}
+
+
 class OrderStore:
     def __init__(self):
         self._mu = threading.Lock()
+        # Copy-on-write: writers replace both the dict and the mutated
+        # OrderState under the lock, so readers can walk the current
+        # reference without locking and never observe a half-updated row.
         self._orders: dict[str, OrderState] = {}
 
+    def _mutated(self, client_order_id) -> OrderState:
+        """Return a private copy of the row to mutate. Caller holds _mu."""
+        st = self._orders.get(client_order_id)
+        if st is None:
+            return OrderState(client_order_id=str(client_order_id))
+        return replace(st)
+
+    def _publish(self, client_order_id, st: OrderState) -> None:
+        """Swap in a new dict containing the updated row. Caller holds _mu."""
+        new_orders = dict(self._orders)
+        new_orders[client_order_id] = st
+        self._orders = new_orders
+
     def note_order_params(self, *, client_order_id, symbol, side, qty, price):
         if not client_order_id:
             return
         with self._mu:
-            st = self._orders.get(client_order_id)
-            if st is None:
-                st = OrderState(client_order_id=str(client_order_id))
-                self._orders[client_order_id] = st
+            st = self._mutated(client_order_id)
             if symbol:
                 st.symbol = str(symbol)
             if side:
                 st.side = str(side)
-            try:
-                if qty is not None:
-                    st.order_qty = float(qty)
-            except Exception:
-                pass
-            try:
-                if price is not None:
-                    st.limit_price = float(price)
-            except Exception:
-                pass
+            v = _f(qty)
+            if v is not None:
+                st.order_qty = v
+            v = _f(price)
+            if v is not None:
+                st.limit_price = v
+            self._publish(client_order_id, st)
 
     def apply_event(self, evt: dict):
-        t = evt.get("type")
-        if t not in ("order_update", "fill", "order_state"):
+        handler = _ORDER_EVENT_HANDLERS.get(evt.get("type"))
+        if handler is None:
             return
 
         cid = evt.get("client_order_id")
@@ -723,125 +1071,58 @@ class OrderStore:
             return
 
         with self._mu:
-            st = self._orders.get(cid)
-            if st is None:
-                st = OrderState(client_order_id=str(cid))
-                self._orders[cid] = st
-
-            if t == "order_state":
-                if evt.get("symbol"):
-                    st.symbol = evt.get("symbol")
-                if evt.get("side"):
-                    st.side = evt.get("side")
-                if evt.get("order_qty") is not None:
-                    try:
-                        st.order_qty = float(evt.get("order_qty"))
-                    except Exception:
-                        pass
-                if evt.get("limit_price") is not None:
-                    try:
-                        st.limit_price = float(evt.get("limit_price"))
-                    except Exception:
-                        pass
-                if evt.get("venue_order_id"):
-                    st.venue_order_id = evt.get("venue_order_id")
-                if evt.get("status"):
-                    st.status = evt.get("status")
-                if evt.get("reason"):
-                    st.reason = evt.get("reason")
-                if evt.get("executed_qty") is not None:
-                    try:
-                        st.executed_qty = float(evt.get("executed_qty"))
-                    except Exception:
-                        pass
-                if evt.get("avg_price") is not None:
-                    try:
-                        st.avg_price = float(evt.get("avg_price"))
-                    except Exception:
-                        pass
-                if evt.get("last_ts_ns"):
-                    st.last_ts_ns = evt.get("last_ts_ns")
-                return
-
-            if t == "order_update":
-                if evt.get("symbol"):
-                    st.symbol = evt.get("symbol")
-                if evt.get("side"):
-                    st.side = evt.get("side")
-                if evt.get("qty") is not None:
-                    try:
-                        st.order_qty = float(evt.get("qty"))
-                    except Exception:
-                        pass
-                if evt.get("price") is not None:
-                    try:
-                        st.limit_price = float(evt.get("price"))
-                    except Exception:
-                        pass
-                if evt.get("venue_order_id"):
-                    st.venue_order_id = evt.get("venue_order_id")
-                if evt.get("status"):
-                    st.status = evt.get("status")
-                if evt.get("reason"):
-                    st.reason = evt.get("reason")
-                if evt.get("ts_ns"):
-                    st.last_ts_ns = evt.get("ts_ns")
-                return
-
-            if t == "fill":
-                if evt.get("symbol"):
-                    st.symbol = evt.get("symbol")
-                qty = evt.get("qty")
-                price = evt.get("price")
-                try:
-                    if qty is not None:
-                        st.executed_qty += float(qty)
-                except Exception:
-                    pass
-                try:
-                    if st.executed_qty > 0 and price is not None:
-                        st.avg_price = float(price)
-                except Exception:
-                    pass
-                if evt.get("ts_ns"):
-                    st.last_ts_ns = evt.get("ts_ns")
-                if st.order_qty is not None and st.order_qty > 0:
-                    if st.executed_qty + 1e-12 >= st.order_qty:
-                        if st.status not in ("CANCELLED", "REJECTED", "EXPIRED"):
-                            st.status = "FILLED"
-                    elif st.executed_qty > 0:
-                        if st.status not in ("CANCELLED", "REJECTED", "EXPIRED"):
-                            st.status = "PARTIALLY_FILLED"
+            st = self._mutated(cid)
+            handler(st, evt)
+            self._publish(cid, st)
 
     def list(self):
-        with self._mu:
-            return [asdict(v) for v in self._orders.values()]
+        return [asdict(v) for v in self._orders.values()]
 
     def get(self, client_order_id: str):
-        with self._mu:
-            v = self._orders.get(client_order_id)
-            return asdict(v) if v else None
+        v = self._orders.get(client_order_id)
+        return asdict(v) if v else None
+
+
+class BinanceResult(NamedTuple):
+    """Outcome of one Binance REST call.
+
+    ok is False for transport and HTTP errors; data then holds the error
+    payload ({"_error": ...} or {"_http_error": ..., "_body": ...}) so
+    callers can still surface details.
+    """
+
+    ok: bool
+    data: object
 
 
 class BinanceSpotRestClient:
+    _PING_PATH = "/api/v3/ping"
+    _ORDER_PATH = "/api/v3/order"
+    _OPEN_ORDERS_PATH = "/api/v3/openOrders"
+    _USER_DATA_STREAM_PATH = "/api/v3/userDataStream"
+
     def __init__(self, base_url, api_key, api_secret):
         self._base_url = (base_url or "").rstrip("/")
         self._api_key = api_key or ""
         self._api_secret = api_secret or ""
+        # Key schedule done once; _sign copies the context per request
+        # instead of redoing the HMAC ipad/opad setup on every call.
+        self._hmac_template = hmac.new(
+            self._api_secret.encode("utf-8"), b"", hashlib.sha256
+        )
 
     def enabled(self):
         return bool(self._base_url and self._api_key and self._api_secret)
 
     def _sign(self, query_string):
-        mac = hmac.new(
-            self._api_secret.encode("utf-8"),
-            query_string.encode("utf-8"),
-            hashlib.sha256,
-        )
+        mac = self._hmac_template.copy()
+        mac.update(query_string.encode("utf-8"))
         return mac.hexdigest()
 
     def _request(self, method, path, params, signed, api_key_only=False):
-        base_params = dict(params or {})
+        # Every caller passes a fresh params dict, so mutate it directly
+        # instead of copying it per request.
+        base_params = params if params is not None else {}
         headers = {"User-Agent": "VeloZ/0.1"}
 
         if api_key_only:
@@ -851,8 +1132,7 @@ class BinanceSpotRestClient:
             base_params.setdefault("timestamp", int(time.time() * 1000))
             base_params.setdefault("recvWindow", 5000)
             query = urlencode(sorted(base_params.items()), doseq=True)
-            sig = self._sign(query)
-            query = query + "&signature=" + sig
+            query = query + "&signature=" + self._sign(query)
             headers["X-MBX-APIKEY"] = self._api_key
         else:
             query = urlencode(sorted(base_params.items()), doseq=True)
@@ -864,19 +1144,20 @@ class BinanceSpotRestClient:
         req = urllib.request.Request(url, method=method, headers=headers)
         try:
             with urllib.request.urlopen(req, timeout=5.0) as resp:
-                body = resp.read().decode("utf-8", errors="replace")
-            return json.loads(body) if body else {}
+                body = resp.read()
+            return BinanceResult(True, _json_loads(body) if body else {})
         except urllib.error.HTTPError as e:
-            raw = e.read().decode("utf-8", errors="replace")
+            raw = e.read()
             try:
-                return {"_http_error": e.code, "_body": json.loads(raw) if raw else {}}
+                body = _json_loads(raw) if raw else {}
             except Exception:
-                return {"_http_error": e.code, "_body": raw}
+                body = raw.decode("utf-8", errors="replace")
+            return BinanceResult(False, {"_http_error": e.code, "_body": body})
         except Exception as e:
-            return {"_error": str(e)}
+            return BinanceResult(False, {"_error": str(e)})
 
     def ping(self):
-        return self._request("GET", "/api/v3/ping", {}, signed=False)
+        return self._request("GET", self._PING_PATH, {}, signed=False)
 
     def place_order(self, *, symbol, side, qty, price, client_order_id):
         params = {
@@ -888,25 +1169,29 @@ class BinanceSpotRestClient:
             "price": price,
             "newClientOrderId": client_order_id,
         }
-        return self._request("POST", "/api/v3/order", params, signed=True)
+        return self._request("POST", self._ORDER_PATH, params, signed=True)
 
     def cancel_order(self, *, symbol, client_order_id):
         params = {"symbol": symbol, "origClientOrderId": client_order_id}
-        return self._request("DELETE", "/api/v3/order", params, signed=True)
+        return self._request("DELETE", self._ORDER_PATH, params, signed=True)
 
     def get_order(self, *, symbol, client_order_id):
         params = {"symbol": symbol, "origClientOrderId": client_order_id}
-        return self._request("GET", "/api/v3/order", params, signed=True)
+        return self._request("GET", self._ORDER_PATH, params, signed=True)
+
+    def open_orders(self, *, symbol=None):
+        params = {"symbol": symbol} if symbol else {}
+        return self._request("GET", self._OPEN_ORDERS_PATH, params, signed=True)
 
     def new_listen_key(self):
         return self._request(
-            "POST", "/api/v3/userDataStream", {}, signed=False, api_key_only=True
+            "POST", self._USER_DATA_STREAM_PATH, {}, signed=False, api_key_only=True
         )
 
     def keepalive_listen_key(self, listen_key):
         return self._request(
             "PUT",
-            "/api/v3/userDataStream",
+            self._USER_DATA_STREAM_PATH,
             {"listenKey": listen_key},
             signed=False,
             api_key_only=True,
@@ -915,21 +1200,52 @@ class BinanceSpotRestClient:
     def close_listen_key(self, listen_key):
         return self._request(
             "DELETE",
-            "/api/v3/userDataStream",
+            self._USER_DATA_STREAM_PATH,
             {"listenKey": listen_key},
             signed=False,
             api_key_only=True,
         )
 
 
+# Client frame headers for the three RFC 6455 length classes, packed in a
+# single C call instead of byte-wise assembly.
+_WS_PACK_SHORT = struct.Struct("!BB").pack
+_WS_PACK_16 = struct.Struct("!BBH").pack
+_WS_PACK_64 = struct.Struct("!BBQ").pack
+
+
+def _ws_mask(payload: bytes, mask_key: bytes) -> bytes:
+    """XOR payload with the repeating 4-byte mask key.
+
+    Runs the XOR through Python's bigints (one C-level pass over 30-bit
+    limbs) instead of a per-byte interpreter loop; on multi-KB frames
+    this is the difference between O(n) C work and O(n) bytecode.
+    """
+    n = len(payload)
+    if not n:
+        return payload
+    mask = (mask_key * ((n + 3) // 4))[:n]
+    return (
+        int.from_bytes(payload, "little") ^ int.from_bytes(mask, "little")
+    ).to_bytes(n, "little")
+
+
 class SimpleWebSocketClient:
     def __init__(self, ws_url, on_text, on_error):
         self._ws_url = ws_url
+        # Parse eagerly: reconnects reuse the tuple and a bad URL fails at
+        # construction instead of on the first connect attempt.
+        self._parsed = self._parse_ws_url()
         self._on_text = on_text
         self._on_error = on_error
         self._sock = None
         self._mu = threading.Lock()
         self._closed = False
+        # Mask keys are drawn from a per-connection pool refilled in one
+        # getrandom call instead of a syscall per frame. Keys stay CSPRNG-
+        # sourced and unpredictable per stream.
+        self._rand_pool = b""
+        self._rand_off = 0
 
     def close(self):
         with self._mu:
@@ -984,7 +1300,7 @@ class SimpleWebSocketClient:
         return u.scheme, host, port, path
 
     def _connect(self):
-        scheme, host, port, path = self._parse_ws_url()
+        scheme, host, port, path = self._parsed
         raw = socket.create_connection((host, port), timeout=10.0)
         if scheme == "wss":
             ctx = ssl.create_default_context()
@@ -1004,31 +1320,30 @@ class SimpleWebSocketClient:
         ).encode("utf-8")
         s.sendall(req)
 
-        buf = b""
+        buf = bytearray()
         while b"\r\n\r\n" not in buf:
             chunk = s.recv(4096)
             if not chunk:
                 raise RuntimeError("ws_handshake_failed")
-            buf += chunk
+            buf.extend(chunk)
             if len(buf) > 64 * 1024:
                 raise RuntimeError("ws_handshake_too_large")
 
-        head, rest = buf.split(b"\r\n\r\n", 1)
+        head, rest = bytes(buf).split(b"\r\n\r\n", 1)
         if b" 101 " not in head.split(b"\r\n", 1)[0]:
             raise RuntimeError("ws_handshake_not_101")
 
         with self._mu:
             self._sock = s
-        self._recv_buffer = rest
+        self._recv_buffer = bytearray(rest)
+        self._recv_pos = 0
 
     def _recv_exact(self, n):
-        out = b""
-        while len(out) < n:
-            if self._recv_buffer:
-                take = min(n - len(out), len(self._recv_buffer))
-                out += self._recv_buffer[:take]
-                self._recv_buffer = self._recv_buffer[take:]
-                continue
+        # Consume via a read cursor: slicing the front off the buffer per
+        # frame reallocated the remainder every time. The buffer only
+        # grows by extend(); consumed bytes are compacted in batches.
+        buf = self._recv_buffer
+        while len(buf) - self._recv_pos < n:
             with self._mu:
                 s = self._sock
             if s is None:
@@ -1036,7 +1351,13 @@ class SimpleWebSocketClient:
             chunk = s.recv(4096)
             if not chunk:
                 raise RuntimeError("ws_closed")
-            self._recv_buffer += chunk
+            buf.extend(chunk)
+        start = self._recv_pos
+        self._recv_pos = start + n
+        out = bytes(buf[start : self._recv_pos])
+        if self._recv_pos > 64 * 1024 and self._recv_pos * 2 > len(buf):
+            del buf[: self._recv_pos]
+            self._recv_pos = 0
         return out
 
     def _recv_frame(self):
@@ -1054,7 +1375,7 @@ class SimpleWebSocketClient:
             mask_key = self._recv_exact(4)
         payload = self._recv_exact(ln) if ln else b""
         if masked and payload:
-            payload = bytes(payload[i] ^ mask_key[i % 4] for i in range(len(payload)))
+            payload = _ws_mask(payload, mask_key)
         if not fin:
             raise RuntimeError("ws_fragments_unsupported")
         return opcode, payload
@@ -1063,6 +1384,11 @@ class SimpleWebSocketClient:
         with self._mu:
             s = self._sock
             closed = self._closed
+            if self._rand_off >= len(self._rand_pool):
+                self._rand_pool = os.urandom(4096)
+                self._rand_off = 0
+            mask_key = self._rand_pool[self._rand_off : self._rand_off + 4]
+            self._rand_off += 4
         if closed or s is None:
             return
 
@@ -1071,19 +1397,45 @@ class SimpleWebSocketClient:
         ln = len(payload)
         mask_bit = 0x80
         if ln < 126:
-            header = bytes([fin_opcode, mask_bit | ln])
+            header = _WS_PACK_SHORT(fin_opcode, mask_bit | ln)
         elif ln < (1 << 16):
-            header = bytes([fin_opcode, mask_bit | 126]) + ln.to_bytes(2, "big")
+            header = _WS_PACK_16(fin_opcode, mask_bit | 126, ln)
         else:
-            header = bytes([fin_opcode, mask_bit | 127]) + ln.to_bytes(8, "big")
-        mask_key = os.urandom(4)
-        masked = bytes(payload[i] ^ mask_key[i % 4] for i in range(ln))
-        s.sendall(header + mask_key + masked)
+            header = _WS_PACK_64(fin_opcode, mask_bit | 127, ln)
+        masked = _ws_mask(payload, mask_key)
+        # Gather-write only on plain sockets: ssl.SSLSocket defines sendmsg
+        # but it unconditionally raises NotImplementedError, and the Binance
+        # stream is always wss://, so TLS connections take the sendall path.
+        if not isinstance(s, ssl.SSLSocket) and hasattr(s, "sendmsg"):
+            # Gather-write via writev: the kernel sees all three pieces
+            # without us concatenating an extra payload-sized buffer.
+            bufs = [header, mask_key, masked]
+            while bufs:
+                sent = s.sendmsg(bufs)
+                while bufs and sent >= len(bufs[0]):
+                    sent -= len(bufs[0])
+                    bufs.pop(0)
+                if bufs and sent:
+                    bufs[0] = bufs[0][sent:]
+        else:
+            s.sendall(header + mask_key + masked)
 
     def _send_pong(self, payload):
         self._send_frame(0xA, payload)
 
 
+# Binance order statuses mapped to the gateway's order-state vocabulary;
+# anything unmapped passes through uppercased.
+_BINANCE_STATUS_MAP = {
+    "NEW": "ACCEPTED",
+    "PARTIALLY_FILLED": "PARTIALLY_FILLED",
+    "FILLED": "FILLED",
+    "CANCELED": "CANCELLED",
+    "REJECTED": "REJECTED",
+    "EXPIRED": "EXPIRED",
+}
+
+
 class ExecutionRouter:
     def __init__(
         self, *, bridge, execution_mode, binance_client, order_store, account_store=None
@@ -1095,19 +1447,42 @@ class ExecutionRouter:
         self._account = account_store or AccountStore()
         self._poll_mu = threading.Lock()
         self._poll: dict[str, dict] = {}
-        self._poll_thread = None
         self._user_stream_mu = threading.Lock()
         self._user_stream_connected = False
         self._user_stream_thread = None
+        # All periodic work (order polling, listen-key keepalive) shares one
+        # timer thread driven by a deadline min-heap instead of a dedicated
+        # sleep-loop thread per task.
+        self._timer_mu = threading.Lock()
+        self._timer_heap = []
+        self._timer_seq = 0
+        self._timer_wakeup = threading.Event()
+        self._timer_thread = None
+        self._poll_last_error_emit = 0.0
+        try:
+            self._poll_interval_s = float(
+                os.environ.get("VELOZ_BINANCE_POLL_INTERVAL_S", "0.5") or 0.5
+            )
+        except ValueError:
+            self._poll_interval_s = 0.5
+        self._ping_mu = threading.Lock()
+        self._ping_cache = None
+        self._ping_cache_ts = 0.0
+        self._ping_cache_ttl_s = 1.0
         if (
             self._execution_mode == "binance_testnet_spot"
             and self._binance
             and self._binance.enabled()
         ):
-            self._poll_thread = threading.Thread(
-                target=self._poll_binance_orders, daemon=True
+            self._schedule(
+                self._poll_interval_s,
+                self._poll_binance_orders_once,
+                interval_s=self._poll_interval_s,
             )
-            self._poll_thread.start()
+            self._timer_thread = threading.Thread(
+                target=self._run_timers, daemon=True
+            )
+            self._timer_thread.start()
             self._user_stream_thread = threading.Thread(
                 target=self._run_binance_user_stream, daemon=True
             )
@@ -1131,6 +1506,22 @@ class ExecutionRouter:
             ),
         }
 
+    def _emit_order_event(self, evt):
+        self._bridge.emit_event(evt)
+        self._orders.apply_event(evt)
+
+    def _reject_event(self, client_order_id, symbol=None):
+        evt = {
+            "type": "order_update",
+            "ts_ns": time.time_ns(),
+            "client_order_id": client_order_id,
+            "status": "REJECTED",
+            "reason": "binance_error",
+        }
+        if symbol:
+            evt["symbol"] = symbol
+        return evt
+
     def orders_state(self):
         return self._orders.list()
 
@@ -1144,9 +1535,20 @@ class ExecutionRouter:
         if self._execution_mode == "binance_testnet_spot":
             if not (self._binance and self._binance.enabled()):
                 return {"ok": False, "error": "binance_not_configured"}
+            # Cache the upstream ping briefly so bursts of health checks
+            # share one round trip instead of each paying a full RTT.
+            with self._ping_mu:
+                if (
+                    self._ping_cache is not None
+                    and time.monotonic() - self._ping_cache_ts < self._ping_cache_ttl_s
+                ):
+                    return self._ping_cache
             r = self._binance.ping()
-            ok = not (isinstance(r, dict) and (r.get("_error") or r.get("_http_error")))
-            return {"ok": ok, "result": r}
+            out = {"ok": r.ok, "result": r.data}
+            with self._ping_mu:
+                self._ping_cache = out
+                self._ping_cache_ts = time.monotonic()
+            return out
         return {"ok": True}
 
     def place_order(self, side, symbol, qty, price, client_order_id):
@@ -1167,40 +1569,36 @@ class ExecutionRouter:
                 price=price,
                 client_order_id=client_order_id,
             )
-            if isinstance(r, dict) and (r.get("_error") or r.get("_http_error")):
-                evt = {
+            if not r.ok:
+                self._emit_order_event(self._reject_event(client_order_id, symbol))
+                return {"ok": False, "error": "binance_error", "details": r.data}
+
+            data = r.data
+            venue_order_id = (
+                str(data.get("orderId"))
+                if isinstance(data, dict) and "orderId" in data
+                else None
+            )
+            self._emit_order_event(
+                {
                     "type": "order_update",
                     "ts_ns": time.time_ns(),
                     "client_order_id": client_order_id,
-                    "status": "REJECTED",
-                    "reason": "binance_error",
+                    "venue_order_id": venue_order_id,
+                    "status": "ACCEPTED",
                     "symbol": symbol,
                 }
-                self._bridge.emit_event(evt)
-                self._orders.apply_event(evt)
-                return {"ok": False, "error": "binance_error", "details": r}
-
-            venue_order_id = (
-                str(r.get("orderId"))
-                if isinstance(r, dict) and "orderId" in r
-                else None
             )
-            evt = {
-                "type": "order_update",
-                "ts_ns": time.time_ns(),
-                "client_order_id": client_order_id,
-                "venue_order_id": venue_order_id,
-                "status": "ACCEPTED",
-                "symbol": symbol,
-            }
-            self._bridge.emit_event(evt)
-            self._orders.apply_event(evt)
             with self._poll_mu:
                 self._poll[client_order_id] = {
                     "symbol": symbol,
                     "last_exec_qty": 0.0,
                     "last_status": "ACCEPTED",
                 }
+            if self._timer_thread is not None:
+                # One-shot immediate poll so the first fill/status for a new
+                # order is not delayed by up to a full poll interval.
+                self._schedule(0.0, self._poll_binance_orders_once)
             return {
                 "ok": True,
                 "client_order_id": client_order_id,
@@ -1222,25 +1620,17 @@ class ExecutionRouter:
             r = self._binance.cancel_order(
                 symbol=market_symbol, client_order_id=client_order_id
             )
-            if isinstance(r, dict) and (r.get("_error") or r.get("_http_error")):
-                evt = {
+            if not r.ok:
+                self._emit_order_event(self._reject_event(client_order_id))
+                return {"ok": False, "error": "binance_error", "details": r.data}
+            self._emit_order_event(
+                {
                     "type": "order_update",
                     "ts_ns": time.time_ns(),
                     "client_order_id": client_order_id,
-                    "status": "REJECTED",
-                    "reason": "binance_error",
+                    "status": "CANCELLED",
                 }
-                self._bridge.emit_event(evt)
-                self._orders.apply_event(evt)
-                return {"ok": False, "error": "binance_error", "details": r}
-            evt = {
-                "type": "order_update",
-                "ts_ns": time.time_ns(),
-                "client_order_id": client_order_id,
-                "status": "CANCELLED",
-            }
-            self._bridge.emit_event(evt)
-            self._orders.apply_event(evt)
+            )
             with self._poll_mu:
                 self._poll.pop(client_order_id, None)
             return {"ok": True, "client_order_id": client_order_id}
@@ -1250,111 +1640,145 @@ class ExecutionRouter:
 
     def _map_binance_status(self, status):
         s = (status or "").upper()
-        if s == "NEW":
-            return "ACCEPTED"
-        if s == "PARTIALLY_FILLED":
-            return "PARTIALLY_FILLED"
-        if s == "FILLED":
-            return "FILLED"
-        if s == "CANCELED":
-            return "CANCELLED"
-        if s == "REJECTED":
-            return "REJECTED"
-        if s == "EXPIRED":
-            return "EXPIRED"
-        return s or "UNKNOWN"
-
-    def _poll_binance_orders(self):
-        last_error_emit = 0.0
+        return _BINANCE_STATUS_MAP.get(s, s or "UNKNOWN")
+
+    def _schedule(self, delay_s, callback, interval_s=None):
+        with self._timer_mu:
+            self._timer_seq += 1
+            heapq.heappush(
+                self._timer_heap,
+                (time.monotonic() + delay_s, self._timer_seq, callback, interval_s),
+            )
+        self._timer_wakeup.set()
+
+    def _run_timers(self):
         while True:
-            time.sleep(0.5)
-            if not (self._binance and self._binance.enabled()):
+            with self._timer_mu:
+                if self._timer_heap:
+                    timeout = self._timer_heap[0][0] - time.monotonic()
+                else:
+                    timeout = None
+            if timeout is None or timeout > 0:
+                self._timer_wakeup.wait(timeout)
+                self._timer_wakeup.clear()
                 continue
-            with self._user_stream_mu:
-                if self._user_stream_connected:
-                    continue
+            with self._timer_mu:
+                _, _, callback, interval_s = heapq.heappop(self._timer_heap)
+            try:
+                keep = callback()
+            except Exception:
+                keep = True
+            # Periodic timers reschedule from completion time unless the
+            # callback opts out by returning False.
+            if interval_s is not None and keep is not False:
+                self._schedule(interval_s, callback, interval_s=interval_s)
+
+    def _poll_binance_orders_once(self):
+        if not (self._binance and self._binance.enabled()):
+            return
+        with self._user_stream_mu:
+            if self._user_stream_connected:
+                return
 
-            with self._poll_mu:
-                items = list(self._poll.items())
+        with self._poll_mu:
+            items = list(self._poll.items())
+        if not items:
+            return
 
-            for cid, meta in items:
-                symbol = meta.get("symbol") or (
-                    self._bridge.config().get("market_symbol") or "BTCUSDT"
-                )
-                r = self._binance.get_order(symbol=symbol, client_order_id=cid)
-                if isinstance(r, dict) and (r.get("_error") or r.get("_http_error")):
-                    now = time.time()
-                    if now - last_error_emit > 5.0:
-                        last_error_emit = now
-                        self._bridge.emit_event(
-                            {
-                                "type": "error",
-                                "ts_ns": time.time_ns(),
-                                "message": "binance_poll_error",
-                            }
-                        )
-                    continue
+        # One batched openOrders round-trip covers every still-open tracked
+        # order; per-cid get_order remains only for orders that have left
+        # the open list (or when the batch call fails) and need their final
+        # state.
+        open_by_cid = {}
+        batch = self._binance.open_orders()
+        if batch.ok and isinstance(batch.data, list):
+            for o in batch.data:
+                ocid = o.get("clientOrderId") if isinstance(o, dict) else None
+                if ocid:
+                    open_by_cid[ocid] = o
+
+        for cid, meta in items:
+            symbol = meta.get("symbol") or (
+                self._bridge.config().get("market_symbol") or "BTCUSDT"
+            )
+            r = open_by_cid.get(cid)
+            if r is None:
+                res = self._binance.get_order(symbol=symbol, client_order_id=cid)
+                r = res.data if res.ok else None
+            # One wall-clock sample stamps every event from this iteration,
+            # which also keeps fill/update timestamps causally ordered.
+            now_ns = time.time_ns()
+            if r is None:
+                now = now_ns / 1e9
+                if now - self._poll_last_error_emit > 5.0:
+                    self._poll_last_error_emit = now
+                    self._bridge.emit_event(
+                        {
+                            "type": "error",
+                            "ts_ns": now_ns,
+                            "message": "binance_poll_error",
+                        }
+                    )
+                continue
 
-                status = self._map_binance_status(
-                    r.get("status") if isinstance(r, dict) else None
+            status = self._map_binance_status(
+                r.get("status") if isinstance(r, dict) else None
+            )
+            try:
+                exec_qty = float(r.get("executedQty", 0.0))
+            except Exception:
+                exec_qty = 0.0
+            try:
+                orig_qty = float(r.get("origQty", 0.0))
+            except Exception:
+                orig_qty = 0.0
+            try:
+                cq = float(r.get("cummulativeQuoteQty", 0.0))
+            except Exception:
+                cq = 0.0
+            avg_price = (cq / exec_qty) if exec_qty > 0 else None
+            if orig_qty > 0:
+                self._orders.note_order_params(
+                    client_order_id=cid,
+                    symbol=symbol,
+                    side=None,
+                    qty=orig_qty,
+                    price=None,
                 )
-                try:
-                    exec_qty = float(r.get("executedQty", 0.0))
-                except Exception:
-                    exec_qty = 0.0
-                try:
-                    orig_qty = float(r.get("origQty", 0.0))
-                except Exception:
-                    orig_qty = 0.0
-                try:
-                    cq = float(r.get("cummulativeQuoteQty", 0.0))
-                except Exception:
-                    cq = 0.0
-                avg_price = (cq / exec_qty) if exec_qty > 0 else None
-                if orig_qty > 0:
-                    self._orders.note_order_params(
-                        client_order_id=cid,
-                        symbol=symbol,
-                        side=None,
-                        qty=orig_qty,
-                        price=None,
-                    )
 
-                last_exec = float(meta.get("last_exec_qty", 0.0) or 0.0)
-                if exec_qty > last_exec:
-                    delta = exec_qty - last_exec
-                    fill_evt = {
-                        "type": "fill",
-                        "ts_ns": time.time_ns(),
-                        "client_order_id": cid,
-                        "symbol": symbol,
-                        "qty": delta,
-                        "price": avg_price,
-                    }
-                    self._bridge.emit_event(fill_evt)
-                    self._orders.apply_event(fill_evt)
-                    meta["last_exec_qty"] = exec_qty
-
-                last_status = meta.get("last_status")
-                if status and status != last_status:
-                    upd = {
-                        "type": "order_update",
-                        "ts_ns": time.time_ns(),
-                        "client_order_id": cid,
-                        "symbol": symbol,
-                        "status": status,
-                    }
-                    self._bridge.emit_event(upd)
-                    self._orders.apply_event(upd)
-                    meta["last_status"] = status
+            last_exec = float(meta.get("last_exec_qty", 0.0) or 0.0)
+            if exec_qty > last_exec:
+                delta = exec_qty - last_exec
+                fill_evt = {
+                    "type": "fill",
+                    "ts_ns": now_ns,
+                    "client_order_id": cid,
+                    "symbol": symbol,
+                    "qty": delta,
+                    "price": avg_price,
+                }
+                self._emit_order_event(fill_evt)
+                meta["last_exec_qty"] = exec_qty
 
-                if status in ("FILLED", "CANCELLED", "REJECTED", "EXPIRED"):
-                    with self._poll_mu:
-                        self._poll.pop(cid, None)
-                else:
-                    with self._poll_mu:
-                        if cid in self._poll:
-                            self._poll[cid] = meta
+            last_status = meta.get("last_status")
+            if status and status != last_status:
+                upd = {
+                    "type": "order_update",
+                    "ts_ns": now_ns,
+                    "client_order_id": cid,
+                    "symbol": symbol,
+                    "status": status,
+                }
+                self._emit_order_event(upd)
+                meta["last_status"] = status
+
+            if status in ("FILLED", "CANCELLED", "REJECTED", "EXPIRED"):
+                with self._poll_mu:
+                    self._poll.pop(cid, None)
+            else:
+                with self._poll_mu:
+                    if cid in self._poll:
+                        self._poll[cid] = meta
 
     def _handle_binance_execution_report(self, msg: dict):
         try:
@@ -1388,19 +1812,25 @@ class ExecutionRouter:
                     price=limit_price,
                 )
 
+            # Build the event once with conditional inserts and hand the
+            # same dict to both sinks; the store ignores keys it does not
+            # read, so no filtered copy is needed.
             upd = {
                 "type": "order_update",
                 "ts_ns": ts_ns,
                 "client_order_id": cid,
-                "venue_order_id": venue_order_id,
                 "status": status,
                 "symbol": symbol,
                 "side": side,
-                "qty": orig_qty if orig_qty > 0 else None,
-                "price": limit_price if limit_price > 0 else None,
             }
+            if venue_order_id is not None:
+                upd["venue_order_id"] = venue_order_id
+            if orig_qty > 0:
+                upd["qty"] = orig_qty
+            if limit_price > 0:
+                upd["price"] = limit_price
             self._bridge.emit_event(upd)
-            self._orders.apply_event({k: v for k, v in upd.items() if v is not None})
+            self._orders.apply_event(upd)
 
             try:
                 last_fill_qty = float(msg.get("l", 0.0))
@@ -1417,12 +1847,11 @@ class ExecutionRouter:
                     "client_order_id": cid,
                     "symbol": symbol,
                     "qty": last_fill_qty,
-                    "price": last_fill_price if last_fill_price > 0 else None,
                 }
+                if last_fill_price > 0:
+                    fill_evt["price"] = last_fill_price
                 self._bridge.emit_event(fill_evt)
-                self._orders.apply_event(
-                    {k: v for k, v in fill_evt.items() if v is not None}
-                )
+                self._orders.apply_event(fill_evt)
         except Exception:
             return
 
@@ -1469,7 +1898,11 @@ class ExecutionRouter:
                 continue
 
             lk = self._binance.new_listen_key()
-            listen_key = lk.get("listenKey") if isinstance(lk, dict) else None
+            listen_key = (
+                lk.data.get("listenKey")
+                if lk.ok and isinstance(lk.data, dict)
+                else None
+            )
             if not listen_key:
                 now = time.time()
                 if now - last_error_emit > 5.0:
@@ -1487,7 +1920,7 @@ class ExecutionRouter:
 
             def on_text(txt):
                 try:
-                    msg = json.loads(txt)
+                    msg = _json_loads(txt)
                 except Exception:
                     return
                 et = msg.get("e")
@@ -1509,17 +1942,26 @@ class ExecutionRouter:
                     )
 
             ws_url = ws_base.rstrip("/") + "/" + listen_key
-            ws = SimpleWebSocketClient(ws_url, on_text=on_text, on_error=on_error)
+            try:
+                ws = SimpleWebSocketClient(ws_url, on_text=on_text, on_error=on_error)
+            except ValueError as e:
+                # The eager URL parse raises here for a malformed
+                # VELOZ_BINANCE_WS_BASE_URL; surface it like any other stream
+                # failure and retry instead of killing this thread.
+                on_error(str(e))
+                try:
+                    self._binance.close_listen_key(listen_key)
+                except Exception:
+                    pass
+                continue
 
-            def keepalive():
-                while not stop_flag["stop"]:
-                    time.sleep(25 * 60)
-                    if stop_flag["stop"]:
-                        return
-                    self._binance.keepalive_listen_key(listen_key)
+            def keepalive(listen_key=listen_key, stop_flag=stop_flag):
+                if stop_flag["stop"]:
+                    return False
+                self._binance.keepalive_listen_key(listen_key)
+                return True
 
-            ka = threading.Thread(target=keepalive, daemon=True)
-            ka.start()
+            self._schedule(25 * 60, keepalive, interval_s=25 * 60)
 
             with self._user_stream_mu:
                 self._user_stream_connected = True
@@ -1537,6 +1979,86 @@ class ExecutionRouter:
                 self._user_stream_connected = False
 
 
+# Serialized SSE frames keyed by event id, shared across stream clients so
+# an event is encoded once no matter how many subscribers replay it. Event
+# ids are immutable once assigned, so entries never go stale; the cache is
+# cleared wholesale when full. Plain dict ops are atomic under the GIL.
+_SSE_FRAME_CACHE: dict = {}
+_SSE_FRAME_CACHE_MAX = 1024
+
+
+def _sse_frame(e) -> bytes:
+    eid = e.get("_id", 0)
+    frame = _SSE_FRAME_CACHE.get(eid)
+    if frame is None:
+        payload = _json_dumps_bytes({k: v for k, v in e.items() if k != "_id"})
+        frame = b"id: %d\nevent: %s\ndata: %s\n\n" % (
+            eid,
+            str(e.get("type", "event")).encode("utf-8"),
+            payload,
+        )
+        if len(_SSE_FRAME_CACHE) >= _SSE_FRAME_CACHE_MAX:
+            _SSE_FRAME_CACHE.clear()
+        _SSE_FRAME_CACHE[eid] = frame
+    return frame
+
+
+# Per-thread request-body buffer, grown to the high-water mark and reused
+# across requests so body reads stop allocating a fresh bytes per POST.
+_tls = threading.local()
+
+
+def _norm(v, *, upper=False, lower=False, strip=False) -> str:
+    """Normalize a request-body field to str.
+
+    Values that are already str skip the str() call, a no-op strip returns
+    the original object, and the case steps only allocate when the input
+    is in the wrong case — so well-formed fields cost no copies.
+    """
+    if type(v) is not str:
+        v = str(v)
+    if strip:
+        v = v.strip()
+    if upper:
+        if not v.isupper():
+            v = v.upper()
+    elif lower:
+        if not v.islower():
+            v = v.lower()
+    return v
+
+
+# Pre-serialized bodies for the tiny fixed responses on the hottest
+# paths; _send_json_bytes writes them without touching the encoder.
+_BODY_OK = _json_dumps_bytes({"ok": True})
+_BODY_BAD_JSON = _json_dumps_bytes({"error": "bad_json"})
+_BODY_BAD_PARAMS = _json_dumps_bytes({"error": "bad_params"})
+_BODY_AUTH_REQUIRED = _json_dumps_bytes({"error": "authentication_required"})
+_BODY_FORBIDDEN_ADMIN = _json_dumps_bytes(
+    {"error": "forbidden", "message": "admin permission required"}
+)
+
+
+def _require_admin(fn):
+    """Gate a handler on an authenticated caller with the admin permission.
+
+    Sends the 401/403 itself, so decorated handlers only run for admins.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(self, *args):
+        auth_info = getattr(self, "_auth_info", None)
+        if not auth_info:
+            self._send_json_bytes(401, _BODY_AUTH_REQUIRED)
+            return
+        if "admin" not in auth_info.get("permissions", ()):
+            self._send_json_bytes(403, _BODY_FORBIDDEN_ADMIN)
+            return
+        return fn(self, *args)
+
+    return wrapper
+
+
 class Handler(SimpleHTTPRequestHandler):
     def end_headers(self):
         self.send_header("Access-Control-Allow-Origin", "*")
@@ -1558,7 +2080,7 @@ class Handler(SimpleHTTPRequestHandler):
         Returns True if request should proceed, False if rejected.
         Sets self._auth_info and self._rate_limit_headers.
         """
-        parsed = urlparse(self.path)
+        parsed = self._parsed_request_url()
         auth_manager = getattr(self.server, "auth_manager", None)
 
         # Default rate limit headers
@@ -1579,12 +2101,16 @@ class Handler(SimpleHTTPRequestHandler):
             return True
 
         # Authenticate
-        request_headers = {k: v for k, v in self.headers.items()}
-        auth_info, error = auth_manager.authenticate(request_headers)
+        # http.client.HTTPMessage supports .get, which is all authenticate
+        # reads; passing it directly avoids copying every header per request.
+        auth_info, error = auth_manager.authenticate(self.headers)
 
         if not auth_info:
             audit_logger.warning(
-                f"Auth failed: path={parsed.path}, ip={self.client_address[0]}, error={error}"
+                "Auth failed: path=%s, ip=%s, error=%s",
+                parsed.path,
+                self.client_address[0],
+                error,
             )
             self._send_json(401, {"error": error})
             return False
@@ -1598,7 +2124,9 @@ class Handler(SimpleHTTPRequestHandler):
 
         if not allowed:
             audit_logger.warning(
-                f"Rate limit exceeded: user={auth_info.get('user_id')}, identifier={identifier}"
+                "Rate limit exceeded: user=%s, identifier=%s",
+                auth_info.get("user_id"),
+                identifier,
             )
             self._send_json(429, {"error": "rate_limit_exceeded"}, headers)
             return False
@@ -1607,12 +2135,17 @@ class Handler(SimpleHTTPRequestHandler):
 
     def _audit_log(self, action: str, details: Optional[dict] = None) -> None:
         """Log an authenticated action for audit."""
+        # Skip all record building when audit logging is filtered out; this
+        # sits on the order/cancel hot path.
+        if not audit_logger.isEnabledFor(logging.INFO):
+            return
         auth_info = getattr(self, "_auth_info", None)
         user_id = auth_info.get("user_id", "anonymous") if auth_info else "anonymous"
         auth_method = auth_info.get("auth_method", "none") if auth_info else "none"
         ip = self.client_address[0]
 
         log_data = {
+            "ts_ns": time.time_ns(),
             "action": action,
             "user": user_id,
             "auth_method": auth_method,
@@ -1621,74 +2154,153 @@ class Handler(SimpleHTTPRequestHandler):
         if details:
             log_data.update(details)
 
-        audit_logger.info(json.dumps(log_data))
+        audit_logger.info(_json_dumps_bytes(log_data).decode("utf-8"))
+
+    _MAX_BODY_BYTES = 1 << 20
+
+    def _read_body_data(self, allow_form=False):
+        """Read and parse the request body.
+
+        Returns the parsed dict, or None if an error response has already
+        been sent. Bodies over _MAX_BODY_BYTES are rejected with 413 before
+        being read.
+        """
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+        except ValueError:
+            self._send_json_bytes(400, _BODY_BAD_PARAMS)
+            return None
+        if length < 0:
+            self._send_json_bytes(400, _BODY_BAD_PARAMS)
+            return None
+        if length > self._MAX_BODY_BYTES:
+            self._send_json(413, {"error": "body_too_large"})
+            return None
+        buf = getattr(_tls, "body_buf", None)
+        if buf is None or len(buf) < length:
+            buf = bytearray(max(length, 4096))
+            _tls.body_buf = buf
+        view = memoryview(buf)
+        read = 0
+        while read < length:
+            n = self.rfile.readinto(view[read:length])
+            if not n:
+                break
+            read += n
+        body = view[:read]
+        if _orjson is None:
+            # stdlib json will not take a memoryview.
+            body = bytes(body)
+        if allow_form:
+            # Fast path the overwhelmingly common literal before paying for
+            # split/strip/lower on the parameterised or odd-cased forms.
+            ct_raw = self.headers.get("Content-Type") or ""
+            if not ct_raw.startswith("application/json"):
+                ct = ct_raw.split(";", 1)[0].strip().lower()
+                if ct != "application/json":
+                    return dict(
+                        parse_qsl(bytes(body).decode("utf-8", errors="replace"))
+                    )
+        try:
+            return _json_loads(body) if body else {}
+        except Exception:
+            self._send_json_bytes(400, _BODY_BAD_JSON)
+            return None
+
+    def _parsed_request_url(self):
+        # One urlparse per request: the verb dispatcher, the auth gate and
+        # query-reading handlers all need the split path. Keyed on self.path
+        # because a keep-alive connection reuses this handler instance.
+        cached = getattr(self, "_url_cache", None)
+        if cached is not None and cached[0] == self.path:
+            return cached[1]
+        parsed = urlparse(self.path)
+        self._url_cache = (self.path, parsed)
+        return parsed
 
     def do_OPTIONS(self):
         self.send_response(204)
         self.end_headers()
 
     def do_GET(self):
-        parsed = urlparse(self.path)
+        parsed = self._parsed_request_url()
 
         # Health check is always public
         if parsed.path == "/health":
-            self._send_json(200, {"ok": True})
+            self._send_json_bytes(200, _BODY_OK)
             return
 
         # Check auth and rate limit for all other endpoints
         if not self._check_auth_and_rate_limit():
             return
 
-        if parsed.path == "/api/config":
-            out = dict(self.server.bridge.config())
-            out.update(self.server.router.config())
-            auth_manager = getattr(self.server, "auth_manager", None)
-            out["auth_enabled"] = auth_manager.is_enabled() if auth_manager else False
-            self._send_json(200, out)
-            return
-        if parsed.path == "/api/orders_state":
-            self._audit_log("list_orders_state")
-            self._send_json(200, {"items": self.server.router.orders_state()})
-            return
-        if parsed.path == "/api/order_state":
-            qs = parse_qs(parsed.query or "")
-            cid = (qs.get("client_order_id") or [""])[0].strip()
-            if not cid:
-                self._send_json(400, {"error": "bad_params"})
-                return
-            st = self.server.router.order_state(cid)
-            if not st:
-                self._send_json(404, {"error": "not_found"})
-                return
-            self._audit_log("get_order_state", {"client_order_id": cid})
-            self._send_json(200, st)
-            return
-        if parsed.path == "/api/execution/ping":
-            self._send_json(200, self.server.router.ping())
-            return
-        if parsed.path == "/api/stream":
-            self._handle_sse(parsed)
-            return
-        if parsed.path == "/api/market":
-            self._send_json(200, self.server.bridge.market())
-            return
-        if parsed.path == "/api/orders":
-            self._audit_log("list_orders")
-            self._send_json(200, {"items": self.server.bridge.orders()})
-            return
-        if parsed.path == "/api/account":
-            self._audit_log("get_account")
-            self._send_json(200, self.server.router.account_state())
-            return
-        if parsed.path == "/api/auth/keys":
-            self._handle_list_api_keys()
-            return
+        handler = self._GET_ROUTES.get(parsed.path)
+        if handler is not None:
+            return handler(self, parsed)
         if parsed.path == "/":
             self.path = "/index.html"
         return super().do_GET()
 
+    def _handle_config(self, parsed):
+        out = dict(self.server.bridge.config())
+        out.update(self.server.router.config())
+        auth_manager = getattr(self.server, "auth_manager", None)
+        out["auth_enabled"] = auth_manager.is_enabled() if auth_manager else False
+        self._send_json(200, out)
+
+    def _handle_orders_state(self, parsed):
+        self._audit_log("list_orders_state")
+        self._send_json(200, {"items": self.server.router.orders_state()})
+
+    def _handle_order_state(self, parsed):
+        qs = dict(parse_qsl(parsed.query or ""))
+        cid = qs.get("client_order_id", "").strip()
+        if not cid:
+            self._send_json(400, {"error": "bad_params"})
+            return
+        st = self.server.router.order_state(cid)
+        if not st:
+            self._send_json(404, {"error": "not_found"})
+            return
+        self._audit_log("get_order_state", {"client_order_id": cid})
+        self._send_json(200, st)
+
+    def _handle_execution_ping(self, parsed):
+        self._send_json(200, self.server.router.ping())
+
+    def _handle_market(self, parsed):
+        self._send_json(200, self.server.bridge.market())
+
+    def _handle_orders(self, parsed):
+        self._audit_log("list_orders")
+        self._send_json(200, {"items": self.server.bridge.orders()})
+
+    def _handle_account(self, parsed):
+        self._audit_log("get_account")
+        self._send_json(200, self.server.router.account_state())
+
+    # O(1) routing for authenticated GET endpoints; /health and the static
+    # fallback are handled in do_GET itself.
+    _GET_ROUTES = {
+        "/api/config": _handle_config,
+        "/api/orders_state": _handle_orders_state,
+        "/api/order_state": _handle_order_state,
+        "/api/execution/ping": _handle_execution_ping,
+        "/api/stream": lambda self, parsed: self._handle_sse(parsed),
+        "/api/market": _handle_market,
+        "/api/orders": _handle_orders,
+        "/api/account": _handle_account,
+        "/api/auth/keys": lambda self, parsed: self._handle_list_api_keys(),
+    }
+
     def do_POST(self):
-        parsed = urlparse(self.path)
+        parsed = self._parsed_request_url()
+
+        # Every POST endpoint lives under /api/; reject probe traffic before
+        # it reaches the auth gate or the route table.
+        if not parsed.path.startswith("/api/"):
+            self.send_error(404)
+            return
 
         # Auth endpoints (login doesn't require prior auth)
         if parsed.path == "/api/auth/login":
@@ -1699,36 +2311,23 @@ class Handler(SimpleHTTPRequestHandler):
         if not self._check_auth_and_rate_limit():
             return
 
-        if parsed.path == "/api/cancel":
-            self._handle_cancel()
-            return
-        if parsed.path == "/api/auth/keys":
-            self._handle_create_api_key()
-            return
-        if parsed.path != "/api/order":
+        handler = self._POST_ROUTES.get(parsed.path)
+        if handler is None:
             self.send_error(404)
             return
+        handler(self)
 
-        length = int(self.headers.get("Content-Length", "0"))
-        body = self.rfile.read(length).decode("utf-8", errors="replace")
-
-        data = None
-        ct = (self.headers.get("Content-Type") or "").split(";")[0].strip().lower()
-        if ct == "application/json":
-            try:
-                data = json.loads(body) if body else {}
-            except Exception:
-                self._send_json(400, {"error": "bad_json"})
-                return
-        else:
-            data = {k: v[0] for k, v in parse_qs(body).items()}
+    def _handle_order(self):
+        data = self._read_body_data(allow_form=True)
+        if data is None:
+            return
 
         try:
-            side = str(data.get("side", "BUY")).upper()
-            symbol = str(data.get("symbol", "BTCUSDT"))
+            side = _norm(data.get("side", "BUY"), upper=True)
+            symbol = _norm(data.get("symbol", "BTCUSDT"))
             qty = float(data.get("qty", 0.0))
             price = float(data.get("price", 0.0))
-            client_order_id = str(
+            client_order_id = _norm(
                 data.get("client_order_id", f"web-{int(time.time()*1000)}")
             )
         except Exception:
@@ -1760,21 +2359,11 @@ class Handler(SimpleHTTPRequestHandler):
         self._send_json(200, r)
 
     def _handle_cancel(self):
-        length = int(self.headers.get("Content-Length", "0"))
-        body = self.rfile.read(length).decode("utf-8", errors="replace")
-
-        data = None
-        ct = (self.headers.get("Content-Type") or "").split(";")[0].strip().lower()
-        if ct == "application/json":
-            try:
-                data = json.loads(body) if body else {}
-            except Exception:
-                self._send_json(400, {"error": "bad_json"})
-                return
-        else:
-            data = {k: v[0] for k, v in parse_qs(body).items()}
+        data = self._read_body_data(allow_form=True)
+        if data is None:
+            return
 
-        client_order_id = str(data.get("client_order_id", "")).strip()
+        client_order_id = _norm(data.get("client_order_id", ""), strip=True)
         if not client_order_id:
             self._send_json(400, {"error": "bad_params"})
             return
@@ -1794,17 +2383,12 @@ class Handler(SimpleHTTPRequestHandler):
 
     def _handle_login(self):
         """Handle login request to get JWT token."""
-        length = int(self.headers.get("Content-Length", "0"))
-        body = self.rfile.read(length).decode("utf-8", errors="replace")
-
-        try:
-            data = json.loads(body) if body else {}
-        except Exception:
-            self._send_json(400, {"error": "bad_json"})
+        data = self._read_body_data()
+        if data is None:
             return
 
-        user_id = str(data.get("user_id", "")).strip()
-        password = str(data.get("password", ""))
+        user_id = _norm(data.get("user_id", ""), strip=True)
+        password = _norm(data.get("password", ""))
 
         if not user_id or not password:
             self._send_json(400, {"error": "bad_params"})
@@ -1817,25 +2401,21 @@ class Handler(SimpleHTTPRequestHandler):
 
         token = auth_manager.create_token(user_id, password)
         if not token:
-            audit_logger.warning(f"Login failed: user={user_id}, ip={self.client_address[0]}")
+            audit_logger.warning("Login failed: user=%s, ip=%s", user_id, self.client_address[0])
             self._send_json(401, {"error": "invalid_credentials"})
             return
 
-        audit_logger.info(f"Login success: user={user_id}, ip={self.client_address[0]}")
+        audit_logger.info("Login success: user=%s, ip=%s", user_id, self.client_address[0])
         self._send_json(200, {"token": token, "token_type": "Bearer"})
 
+    @_require_admin
     def _handle_create_api_key(self):
         """Handle API key creation."""
-        length = int(self.headers.get("Content-Length", "0"))
-        body = self.rfile.read(length).decode("utf-8", errors="replace")
-
-        try:
-            data = json.loads(body) if body else {}
-        except Exception:
-            self._send_json(400, {"error": "bad_json"})
+        data = self._read_body_data()
+        if data is None:
             return
 
-        name = str(data.get("name", "")).strip()
+        name = _norm(data.get("name", ""), strip=True)
         if not name:
             self._send_json(400, {"error": "bad_params", "message": "name is required"})
             return
@@ -1845,23 +2425,12 @@ class Handler(SimpleHTTPRequestHandler):
             self._send_json(400, {"error": "bad_params", "message": "permissions must be a list"})
             return
 
-        auth_info = getattr(self, "_auth_info", None)
-        if not auth_info:
-            self._send_json(401, {"error": "authentication_required"})
-            return
-
-        # Check if user has admin permission to create keys
-        user_permissions = auth_info.get("permissions", [])
-        if "admin" not in user_permissions:
-            self._send_json(403, {"error": "forbidden", "message": "admin permission required"})
-            return
-
         auth_manager = getattr(self.server, "auth_manager", None)
         if not auth_manager:
             self._send_json(500, {"error": "auth_not_configured"})
             return
 
-        user_id = auth_info.get("user_id", "unknown")
+        user_id = self._auth_info.get("user_id", "unknown")
         key_id, raw_key = auth_manager.create_api_key(user_id, name, permissions)
 
         self._audit_log("create_api_key", {"key_id": key_id, "name": name})
@@ -1895,37 +2464,31 @@ class Handler(SimpleHTTPRequestHandler):
 
     def do_DELETE(self):
         """Handle DELETE requests."""
-        parsed = urlparse(self.path)
+        parsed = self._parsed_request_url()
 
-        if not self._check_auth_and_rate_limit():
+        if not parsed.path.startswith("/api/"):
+            self.send_error(404)
             return
 
-        if parsed.path == "/api/auth/keys":
-            self._handle_revoke_api_key()
+        if not self._check_auth_and_rate_limit():
             return
 
-        self.send_error(404)
+        handler = self._DELETE_ROUTES.get(parsed.path)
+        if handler is None:
+            self.send_error(404)
+            return
+        handler(self, parsed)
 
-    def _handle_revoke_api_key(self):
+    @_require_admin
+    def _handle_revoke_api_key(self, parsed):
         """Handle API key revocation."""
-        qs = parse_qs(urlparse(self.path).query or "")
-        key_id = (qs.get("key_id") or [""])[0].strip()
+        qs = dict(parse_qsl(parsed.query or ""))
+        key_id = qs.get("key_id", "").strip()
 
         if not key_id:
             self._send_json(400, {"error": "bad_params", "message": "key_id is required"})
             return
 
-        auth_info = getattr(self, "_auth_info", None)
-        if not auth_info:
-            self._send_json(401, {"error": "authentication_required"})
-            return
-
-        # Check if user has admin permission
-        user_permissions = auth_info.get("permissions", [])
-        if "admin" not in user_permissions:
-            self._send_json(403, {"error": "forbidden", "message": "admin permission required"})
-            return
-
         auth_manager = getattr(self.server, "auth_manager", None)
         if not auth_manager:
             self._send_json(500, {"error": "auth_not_configured"})
@@ -1939,12 +2502,25 @@ class Handler(SimpleHTTPRequestHandler):
         self._audit_log("revoke_api_key", {"key_id": key_id})
         self._send_json(200, {"ok": True, "key_id": key_id})
 
+    # Authenticated POST/DELETE endpoints, resolved with one hash probe like
+    # _GET_ROUTES; /api/auth/login stays inline in do_POST ahead of the
+    # auth gate.
+    _POST_ROUTES = {
+        "/api/order": _handle_order,
+        "/api/cancel": _handle_cancel,
+        "/api/auth/keys": _handle_create_api_key,
+    }
+
+    _DELETE_ROUTES = {
+        "/api/auth/keys": _handle_revoke_api_key,
+    }
+
     def _handle_sse(self, parsed):
-        qs = parse_qs(parsed.query or "")
+        qs = dict(parse_qsl(parsed.query or ""))
         last_id = None
         try:
             if "last_id" in qs:
-                last_id = int(qs["last_id"][0])
+                last_id = int(qs["last_id"])
         except Exception:
             last_id = None
 
@@ -1963,17 +2539,20 @@ class Handler(SimpleHTTPRequestHandler):
                     continue
 
                 events, last_id = self.server.bridge.pop_events(last_id)
-                for e in events:
-                    eid = e.get("_id", 0)
-                    payload = json.dumps({k: v for k, v in e.items() if k != "_id"})
-                    msg = f"id: {eid}\nevent: {e.get('type','event')}\ndata: {payload}\n\n"
-                    self.wfile.write(msg.encode("utf-8"))
+                if events:
+                    # One write per batch: join is C-level and avoids a
+                    # buffered-writer memmove per event.
+                    self.wfile.write(b"".join([_sse_frame(e) for e in events]))
                 self.wfile.flush()
         except Exception:
             return
 
     def _send_json(self, status, obj, extra_headers: Optional[dict] = None):
-        payload = json.dumps(obj).encode("utf-8")
+        self._send_json_bytes(status, _json_dumps_bytes(obj), extra_headers)
+
+    def _send_json_bytes(
+        self, status, payload: bytes, extra_headers: Optional[dict] = None
+    ):
         self.send_response(status)
         self.send_header("Content-Type", "application/json; charset=utf-8")
         self.send_header("Content-Length", str(len(payload)))
@@ -0,0 +1,59 @@
+import base64
+import hashlib
+import hmac
+import json
+import runpy
+import time
+import unittest
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+class TestJwtSigning(unittest.TestCase):
+    def setUp(self):
+        ns = runpy.run_path("/home/zzzode/Develop/VeloZ/apps/gateway/gateway.py")
+        self.manager = ns["JWTManager"]("secret", token_expiry_seconds=3600)
+
+    def test_blk2_create_verify_roundtrip(self):
+        token = self.manager.create_token("alice", api_key_id="key-1")
+
+        header = json.loads(
+            base64.urlsafe_b64decode(token.split(".")[0] + "==")
+        )
+        self.assertEqual(header["alg"], "BLK2")
+
+        payload = self.manager.verify_token(token)
+        self.assertIsNotNone(payload)
+        self.assertEqual(payload["sub"], "alice")
+        self.assertEqual(payload["kid"], "key-1")
+
+    def test_legacy_hs256_token_still_verifies(self):
+        now = int(time.time())
+        header_b64 = _b64url(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+        payload_b64 = _b64url(
+            json.dumps({"sub": "bob", "iat": now, "exp": now + 60}).encode()
+        )
+        message = f"{header_b64}.{payload_b64}".encode("ascii")
+        sig_b64 = _b64url(hmac.digest(b"secret", message, hashlib.sha256))
+        token = f"{header_b64}.{payload_b64}.{sig_b64}"
+
+        payload = self.manager.verify_token(token)
+        self.assertIsNotNone(payload)
+        self.assertEqual(payload["sub"], "bob")
+
+    def test_tampered_signature_rejected(self):
+        token = self.manager.create_token("alice")
+        head, _, sig = token.rpartition(".")
+        flipped = ("A" if sig[0] != "A" else "B") + sig[1:]
+        self.assertIsNone(self.manager.verify_token(f"{head}.{flipped}"))
+
+    def test_expired_token_rejected(self):
+        expired = type(self.manager)("secret", token_expiry_seconds=-10)
+        token = expired.create_token("alice")
+        self.assertIsNone(self.manager.verify_token(token))
+
+
+if __name__ == "__main__":
+    unittest.main()